@@ -13,9 +13,11 @@ an example for similar data, i.e., there is no BIRC specific code.
 Requirements
 ------------
 
-* Python 2.7+
+* Python 3.8+
 * numpy
 * matplotlib
+* lxml (optional, for faster label parsing)
+* numba (optional, for faster `materialize_display`)
 * BIRC data from the PDS archive, e.g., https://pdssbn.astro.umd.edu/holdings/pds4-bopps2014:scoadded-v1.0/SUPPORT/dataset.html
 
 
@@ -66,11 +68,100 @@ PDS4_Array_2D_Image - A PDS4 2D image.
 Functions
 ---------
 read_image      - Read a BIRC image described by a PDS4 label file.
+read_images     - Read many BIRC images in parallel threads.
 read_pds4_array - Read a PDS4 data array.
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# matplotlib is only needed for display
+try:
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
+# numba is only needed for fast copies of the display orientation
+try:
+    from numba import njit, prange, uint32
+except ImportError:
+    njit = None
+
+if njit is None:
+    _reorient_swap32 = None
+else:
+    @njit(cache=True)
+    def _bswap32(x):
+        return ((x >> uint32(24)) | ((x >> uint32(8)) & uint32(0xff00))
+                | ((x << uint32(8)) & uint32(0xff0000)) | (x << uint32(24)))
+
+    @njit(parallel=True, cache=True)
+    def _reorient_swap32(src, flip_v, flip_h, out):
+        """Copy 32-bit words from `src` into `out`, byte swapped.
+
+        Axes are flipped as requested.  The copy is done in tiles to
+        keep the strided reads of a transposed `src` in cache.
+
+        """
+        H, W = out.shape
+        TILE = 64
+        for p in prange((H + TILE - 1) // TILE):
+            i0 = np.int64(p) * TILE
+            for j0 in range(0, W, TILE):
+                j1 = min(j0 + TILE, W)
+                for i in range(i0, min(i0 + TILE, H)):
+                    si = H - 1 - i if flip_v else i
+                    if flip_h:
+                        for j in range(j0, j1):
+                            out[i, j] = _bswap32(src[si, W - 1 - j])
+                    else:
+                        for j in range(j0, j1):
+                            out[i, j] = _bswap32(src[si, j])
+
+# namespace definitions
+NS = {'pds4': 'http://pds.nasa.gov/pds4/pds/v1',
+      'disp': 'http://pds.nasa.gov/pds4/disp/v1'}
+
+# Prefer lxml, which parses in C and compiles XPath expressions once.
+# The paths below are valid for both lxml's XPath and ElementTree's
+# limited ElementPath syntax, so searches fall back to findall for
+# standard library elements or other namespace definitions.
+try:
+    from lxml import etree as ET
+
+    def _xpath(path):
+        compiled = ET.XPath(path, namespaces=NS)
+
+        def find(element, ns=NS):
+            if ns == NS and ET.iselement(element):
+                return compiled(element)
+            return element.findall(path, ns)
+
+        return find
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    def _xpath(path):
+        return lambda element, ns=NS: element.findall(path, ns)
+
+# label element searches, relative to the label root
+_FIND_ARRAY = _xpath('./pds4:File_Area_Observational[pds4:Array_2D_Image]')
+_FIND_DISPLAY_SETTINGS = _xpath(
+    './pds4:Observation_Area/pds4:Discipline_Area/disp:Display_Settings')
+
+# Array_2D_Image element searches
+_FIND_AXES = _xpath('./pds4:Axis_Array')
+
+# label element paths, relative to the label and Array_2D_Image
+_ARRAY_XPATH = './pds4:File_Area_Observational/pds4:Array_2D_Image'
+_LOCAL_ID = './pds4:local_identifier'
+_AXIS_NAME = './pds4:axis_name'
+_AXIS_SEQ = './pds4:sequence_number'
+_AXIS_ELEMENTS = './pds4:elements'
 
 class PDS4_Array_2D_Image(object):
     """A PDS4 array for 2D images, with limited functionality.
@@ -83,11 +174,15 @@ class PDS4_Array_2D_Image(object):
       The label's local_identifier for this array.
     label : ElementTree
       The PDS4 label that contains the description of the array.
+    axes : dict, optional
+      The array index of each axis, keyed by axis_name.  If `None`,
+      it is read from the label.
 
     Attributes
     ----------
     data : ndarray
-      See Parameters.
+      See Parameters.  Setting new data discards the cached
+      `display_data` and `native()` arrays.
     label : ElementTree
       See Parameters.
     local_identifier : string
@@ -102,43 +197,44 @@ class PDS4_Array_2D_Image(object):
       The data array rotated into display orientation, assuming the
       display will draw the image with the origin in the lower left
       corner.  The vertical axis will be axis 0, the horizontal axis
-      will be axis 1.
+      will be axis 1.  Computed on first access.
 
     """
 
-    def __init__(self, data, local_identifier, label):
+    def __init__(self, data, local_identifier, label, axes=None):
         self.data = data
         self.local_identifier = local_identifier
         self.label = label
-        self._orient()
+        self._orient(axes)
 
-    def _orient(self):
-        """Set object image orientation attributes."""
+    @property
+    def data(self):
+        return self._data
 
-        # namespace definitions
-        ns = {'pds4': 'http://pds.nasa.gov/pds4/pds/v1',
-              'disp': 'http://pds.nasa.gov/pds4/disp/v1'}
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._native = None
+        self.__dict__.pop('display_data', None)
 
-        # find local_identifier in File_Area_Observational
-        array = None
-        xpath = ('./pds4:File_Area_Observational/pds4:Array_2D_Image/'
-                 '[pds4:local_identifier]')
-        for e in self.label.findall(xpath, ns):
-            this_local_id = e.find('./pds4:local_identifier', ns).text.strip()
-            if this_local_id == self.local_identifier:
-                array = e
-                break
+    @cached_property
+    def display_data(self):
+        return self._build_display_view()
 
-        assert array is not None, "Array_2D_Image with local_identifier == {} not found.".format(self.local_identifier)
+    def _orient(self, axes=None):
+        """Set object image orientation attributes."""
+
+        root = self.label.getroot()
+
+        if axes is None:
+            axes = self._axes_from_label()
 
         # find display_settings_to_array for local_identifier in
         # Display_Settings
         display_settings = None
-        xpath = ('./pds4:Observation_Area/pds4:Discipline_Area/'
-                 'disp:Display_Settings')
-        for e in self.label.findall(xpath, ns):
-            lir = e.find('./pds4:Local_Internal_Reference', ns)
-            reference = lir.find('./pds4:local_identifier_reference', ns).text.strip()
+        for e in _FIND_DISPLAY_SETTINGS(root):
+            lir = e.find('./pds4:Local_Internal_Reference', NS)
+            reference = lir.find('./pds4:local_identifier_reference', NS).text.strip()
             if reference == self.local_identifier:
                 display_settings = e
                 break
@@ -146,29 +242,132 @@ class PDS4_Array_2D_Image(object):
         assert display_settings is not None, "Display_Settings for local_identifier == {} not found.".format(self.local_identifier)
 
         # determine display directions
-        display_dir = e.find('./disp:Display_Direction', ns)
-        h = display_dir.find('./disp:horizontal_display_direction', ns)
-        v = display_dir.find('./disp:vertical_display_direction', ns)
+        display_dir = display_settings.find('./disp:Display_Direction', NS)
+        h = display_dir.find('./disp:horizontal_display_direction', NS)
+        v = display_dir.find('./disp:vertical_display_direction', NS)
         self.display_directions = (h.text.strip(), v.text.strip())
 
         # determine horizonal and vertical axes
-        haxis = display_dir.find('./disp:horizontal_display_axis', ns).text.strip()
-        for axis in array.findall('./pds4:Axis_Array', ns):
-            if axis.find('./pds4:axis_name', ns).text.strip() == haxis:
-                sn = int(axis.find('./pds4:sequence_number', ns).text.strip())
-                self.horizontal_axis = sn - 1
-
-        vaxis = display_dir.find('./disp:vertical_display_axis', ns).text.strip()
-        for axis in array.findall('./pds4:Axis_Array', ns):
-            if axis.find('./pds4:axis_name', ns).text.strip() == vaxis:
-                sn = int(axis.find('./pds4:sequence_number', ns).text.strip())
-                self.vertical_axis = sn - 1
-
-    def show(self, **kwargs):
+        haxis = display_dir.find('./disp:horizontal_display_axis', NS).text.strip()
+        vaxis = display_dir.find('./disp:vertical_display_axis', NS).text.strip()
+        self.horizontal_axis = axes[haxis]
+        self.vertical_axis = axes[vaxis]
+
+    def _axes_from_label(self):
+        """Read the array index of each axis from the label."""
+
+        # find local_identifier in File_Area_Observational; fall back
+        # to a whitespace tolerant search, since the predicate must
+        # match the element text exactly, and cannot quote identifiers
+        # containing '"'
+        array = None
+        if '"' not in self.local_identifier:
+            xpath = ('./pds4:File_Area_Observational/pds4:Array_2D_Image'
+                     '[pds4:local_identifier="{}"]').format(self.local_identifier)
+            array = self.label.find(xpath, NS)
+        if array is None:
+            for e in self.label.findall(_ARRAY_XPATH, NS):
+                this_local_id = e.find(_LOCAL_ID, NS).text.strip()
+                if this_local_id == self.local_identifier:
+                    array = e
+                    break
+
+        assert array is not None, "Array_2D_Image with local_identifier == {} not found.".format(self.local_identifier)
+
+        return _read_axes(array)[1]
+
+    def _build_display_view(self):
+        """Return a view of the data in display orientation.
+
+        The axis order and flips are folded into the shape and strides
+        of a single view, anchored at the data element displayed in the
+        lower left corner.
+
+        """
+
+        data = self.data
+        v, h = self.vertical_axis, self.horizontal_axis
+        flip = {v: 'Top to Bottom' in self.display_directions,
+                h: 'Right to Left' in self.display_directions}
+
+        corner = tuple(slice(-1, None) if flip[axis] else slice(None)
+                       for axis in range(data.ndim))
+        shape = (data.shape[v], data.shape[h])
+        strides = tuple(-data.strides[axis] if flip[axis]
+                        else data.strides[axis] for axis in (v, h))
+
+        return as_strided(data[corner], shape=shape, strides=strides)
+
+    def native(self):
+        """The data in native byte order.
+
+        The data are memory mapped, read-only, in the file's byte order
+        (big-endian for BIRC).  On the first call, the array is read
+        and byte swapped into memory, if needed, and the result is
+        cached for subsequent calls.
+
+        Returns
+        -------
+        data : ndarray
+
+        """
+
+        if self._native is None:
+            if self.data.dtype.isnative:
+                self._native = self.data
+            else:
+                dtype = self.data.dtype.newbyteorder('=')
+                self._native = np.array(self.data, dtype=dtype)
+
+        return self._native
+
+    def materialize_display(self):
+        """A contiguous copy of the data in display orientation.
+
+        Useful when the display orientation must be written out, e.g.,
+        saved to an image file.  The copy is in native byte order.  It
+        is made with NumPy, except when the display orientation
+        transposes non-native 32-bit data (e.g., BIRC's big-endian
+        floats) and numba is available: then the data are transposed
+        and byte swapped in a single tiled, parallel pass.
+
+        Returns
+        -------
+        im : ndarray
+          The vertical axis will be axis 0, the horizontal axis will be
+          axis 1.
+
+        """
+
+        # NumPy's copy is as fast unless rows must be gathered from
+        # strided columns
+        dtype = self.data.dtype.newbyteorder('=')
+        src = np.moveaxis(self.data, self.vertical_axis, 0)
+        if (_reorient_swap32 is None or self.data.dtype.isnative
+                or self.data.dtype.itemsize != 4
+                or src.strides[1] == src.itemsize):
+            return np.ascontiguousarray(self.display_data, dtype=dtype)
+
+        # swap the raw 32-bit words rather than making a native copy
+        # of the source
+        src = np.asarray(src).view(dtype).view(np.uint32)
+        out = np.empty(src.shape, dtype=dtype)
+        _reorient_swap32(src, 'Top to Bottom' in self.display_directions,
+                         'Right to Left' in self.display_directions,
+                         out.view(np.uint32))
+
+        return out
+
+    def show(self, ax=None, **kwargs):
         """Display this image with the correct orientation.
 
         Parameters
         ----------
+        ax : matplotlib.axes.Axes, optional
+          Draw into these axes.  If the axes already hold an image,
+          its data are replaced, e.g., for the frames of an animation,
+          and `kwargs` are ignored.  Otherwise, a new image is drawn
+          into `ax`, or the current axes when `ax` is `None`.
         **kwargs
           Any maplotlib imshow keyword argument except `origin`.
 
@@ -178,18 +377,21 @@ class PDS4_Array_2D_Image(object):
 
         """
 
-        import matplotlib.pyplot as plt
+        if plt is None:
+            raise ImportError("matplotlib is required to display images.")
 
         assert 'origin' not in kwargs, "origin keyword not allowed."
-        
-        # only need to roll one axis for a 2D image
-        im = np.rollaxis(self.data, self.vertical_axis)
-        if 'Right to Left' in self.display_directions:
-            im = im[:, ::-1]
-        if 'Top to Bottom' in self.display_directions:
-            im = im[::-1]
 
-        return plt.imshow(im, origin='lower', **kwargs)
+        if ax is None:
+            return plt.imshow(self.display_data, origin='lower', **kwargs)
+
+        if ax.images:
+            image = ax.images[0]
+            image.set_data(self.display_data)
+            ax.figure.canvas.draw_idle()
+            return image
+
+        return ax.imshow(self.display_data, origin='lower', **kwargs)
 
 def read_image(file_name):
     """Read a BIRC image described by a PDS4 label file.
@@ -214,27 +416,81 @@ def read_image(file_name):
     """
 
     import os
-    import xml.etree.ElementTree as ET
-
-    # namespace definitions
-    ns = {'pds4': 'http://pds.nasa.gov/pds4/pds/v1'}
 
     label = ET.parse(file_name)
 
     # Find the first File_Area_Observational element with an Array_2D_Image
-    find = label.findall(
-        'pds4:File_Area_Observational/[pds4:Array_2D_Image]', ns)
+    find = _FIND_ARRAY(label.getroot())
 
     if len(find) > 1:
         raise NotImplementedError("Multiple Array_2D_Image elements found.")
     else:
         file_area = find[0]
 
-    data, local_identifier = read_pds4_array(
-        file_area, './pds4:Array_2D_Image', ns,
+    data, local_identifier, axes = _read_array(
+        file_area, './pds4:Array_2D_Image', NS,
         dirname=os.path.dirname(file_name))
 
-    return PDS4_Array_2D_Image(data, local_identifier, label)
+    return PDS4_Array_2D_Image(data, local_identifier, label, axes=axes)
+
+def read_images(file_names, workers=8):
+    """Read many BIRC images described by PDS4 label files.
+
+    The labels are read with `read_image` in a pool of threads.  Only
+    lxml's parsing of each label file runs without the GIL, so the
+    threads can overlap just that step, and only on a multi-core
+    machine.  The label searches are Python code that holds the GIL,
+    and the pixel data are memory mapped, not read, so there is no
+    pixel I/O to overlap.  With the standard library's ElementTree
+    parser, which holds the GIL throughout, expect no gain over
+    calling `read_image` in a loop.
+
+    Parameters
+    ----------
+    file_names : iterable of string
+      The names of the PDS4 label files.
+    workers : int, optional
+      The number of threads.
+
+    Returns
+    -------
+    images : list of PDS4_Array_2D_Image
+      The images, in the same order as `file_names`.
+
+    """
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(read_image, file_names))
+
+def _read_axes(array, ns=NS):
+    """Describe the axes of a PDS4 array in a single pass.
+
+    Parameters
+    ----------
+    array : ElementTree Element
+      The array element from the PDS4 label, e.g., Array_2D_Image.
+    ns : dictionary, optional
+      Namespace definitions for `array.find()`.
+
+    Returns
+    -------
+    shape : tuple of int
+      The array shape, ordered by axis sequence number.
+    indices : dict
+      The array index of each axis, keyed by axis_name.
+
+    """
+
+    axes = []
+    for axis in _FIND_AXES(array, ns):
+        axes.append((int(axis.find(_AXIS_SEQ, ns).text.strip()),
+                     int(axis.find(_AXIS_ELEMENTS, ns).text.strip()),
+                     axis.find(_AXIS_NAME, ns).text.strip()))
+    axes.sort()
+
+    shape = tuple(n for _, n, _ in axes)
+    indices = {name: i for i, (_, _, name) in enumerate(axes)}
+    return shape, indices
 
 def read_pds4_array(file_area, xpath, ns, dirname=''):
     """Read a PDS4 data array.
@@ -253,8 +509,8 @@ def read_pds4_array(file_area, xpath, ns, dirname=''):
 
     Returns
     -------
-    data : ndarray
-      The array.
+    data : numpy.memmap
+      The array, memory mapped read-only from the data file.
     local_identifier : string
       The local_identifier of the array, or `None` if not present.
 
@@ -265,6 +521,19 @@ def read_pds4_array(file_area, xpath, ns, dirname=''):
 
     """
 
+    data, local_identifier, axes = _read_array(file_area, xpath, ns,
+                                               dirname=dirname)
+    return data, local_identifier
+
+def _read_array(file_area, xpath, ns, dirname=''):
+    """Read a PDS4 data array, see `read_pds4_array`.
+
+    Also returns the array index of each axis, keyed by axis_name, so
+    that `read_image` can orient the image without reading the axes
+    again.
+
+    """
+
     import os
 
     file_name = file_area.find('pds4:File/pds4:file_name', ns).text.strip()
@@ -284,33 +553,36 @@ def read_pds4_array(file_area, xpath, ns, dirname=''):
     except KeyError:
         raise NotImplementedError("PDS4 data_type {} not implemented.".format(k))
 
-    # determine the shape
-    ndim = int(array.find('pds4:axes', ns).text.strip())
-    shape = ()
-    for i in range(ndim):
-        k = ('./pds4:Axis_Array/[pds4:sequence_number="{}"]/pds4:elements').format(i + 1)
-        shape += (int(array.find(k, ns).text.strip()), )
+    # determine the shape and layout
+    shape, axes = _read_axes(array, ns)
+    offset = array.find('./pds4:offset', ns)
+    offset_bytes = int(offset.text.strip())
 
-    # verify axis order
-    axis_index_order = array.find('./pds4:axis_index_order', ns).text.strip()
-    assert axis_index_order == 'Last Index Fastest', "Invalid axis order: {}".format(axis_index_order)
+    # label consistency checks and axis order, skipped with python -O
+    if __debug__:
+        ndim = int(array.find('pds4:axes', ns).text.strip())
+        assert len(shape) == ndim, "Expected {} Axis_Array elements, found {}.".format(ndim, len(shape))
+        assert offset.attrib['unit'].lower() == 'byte', "Invalid file offset unit"
+        axis_index_order = array.find('./pds4:axis_index_order', ns).text.strip()
+        assert axis_index_order == 'Last Index Fastest', "Invalid axis order: {}".format(axis_index_order)
 
-    offset = array.find('./pds4:offset', ns)
-    assert offset.attrib['unit'].lower() == 'byte', "Invalid file offset unit"
-    with open(file_name, 'r') as inf:
-        inf.seek(int(offset.text.strip()))
-        data = np.fromfile(inf, dtype, count=np.prod(shape)).reshape(shape)
+    # Memory map the array rather than reading it: pixels are paged in
+    # from disk only when accessed.
+    data = np.memmap(file_name, dtype=dtype, mode='r', offset=offset_bytes,
+                     shape=shape)
 
-    return data, local_identifier
+    return data, local_identifier, axes
 
 if __name__ == '__main__':
     import argparse
-    import matplotlib.pyplot as plt
 
     parser = argparse.ArgumentParser(description='Display a BIRC image with correct orientation.')
     parser.add_argument('label', help='PDS4 label to the image of interest.')
     args = parser.parse_args()
-    
+
+    if plt is None:
+        raise ImportError("matplotlib is required to display images.")
+
     plt.clf()
     im = read_image(args.label)
     im.show(cmap='gray')
@@ -15,7 +15,7 @@ example.
 Requirements
 ------------
 
-* Python 2.7+
+* Python 3.8+
 * numpy
 * matplotlib
 * BIRC data from the PDS archive, e.g., https://pdssbn.astro.umd.edu/holdings/pds4-bopps2014:scoadded-v1.0/SUPPORT/dataset.html
@@ -23,6 +23,7 @@ Requirements
 """
 
 # required modules
+import math
 import os
 import xml.etree.ElementTree as ET
 import numpy as np
@@ -68,9 +69,9 @@ for i in [1, 2]:
 
 # read in the data
 offset = array.find('./pds4:offset', ns)
-with open(file_name, 'r') as inf:
+with open(file_name, 'rb') as inf:
     inf.seek(int(offset.text))
-    data = np.fromfile(inf, dtype, count=np.prod(shape)).reshape(shape)
+    data = np.fromfile(inf, dtype, count=math.prod(shape)).reshape(shape)
 
 # Rotate the data into display orientation (origin in lower left).
 